@@ -1,15 +1,22 @@
 """Device configuration backup service."""
 
+import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from ..utils.files import ensure_backup_directory, write_config_to_file
+from ..utils.files import (
+    backup_timestamp,
+    ensure_backup_directory,
+    write_config_to_file,
+)
 from .napalm import run_napalm_get
 from .runner import GLOBAL_ERROR_HOST
 
 
-def _process_host(hostname: str, data: Any, backup_path: Path) -> dict[str, Any]:
+def _process_host(
+    hostname: str, data: Any, backup_path: Path, timestamp: str
+) -> dict[str, Any]:
     """Translate a single runner output entry into a backup record.
 
     Args:
@@ -17,6 +24,7 @@ def _process_host(hostname: str, data: Any, backup_path: Path) -> dict[str, Any]
         data: Per-host payload from the runner. May be a successful result
             dict, a failure dict, or a non-dict (defensive default).
         backup_path: Directory where config files are written.
+        timestamp: Filename timestamp shared by every host in the run.
 
     Returns:
         Either an error record (`{"error": True, "code": ..., "message": ...}`)
@@ -41,7 +49,7 @@ def _process_host(hostname: str, data: Any, backup_path: Path) -> dict[str, Any]
             "message": "No config data returned",
         }
 
-    file_path = write_config_to_file(hostname, config, backup_path)
+    file_path = write_config_to_file(hostname, config, backup_path, timestamp=timestamp)
     return {
         "path": str(file_path),
         "size_bytes": file_path.stat().st_size,
@@ -83,12 +91,16 @@ async def backup_device_configs(
     if GLOBAL_ERROR_HOST in result:
         return result
 
-    return {
-        "hosts": {
-            hostname_: _process_host(hostname_, data, backup_path)
+    # One timestamp per run so every file from this backup sorts together
+    timestamp = backup_timestamp()
+    # File writes run in worker threads so they overlap and stay off the loop
+    records = await asyncio.gather(
+        *(
+            asyncio.to_thread(_process_host, hostname_, data, backup_path, timestamp)
             for hostname_, data in result.items()
-        },
-    }
+        )
+    )
+    return {"hosts": dict(zip(result, records, strict=True))}
 
 
 __all__: list[str] = ["backup_device_configs"]
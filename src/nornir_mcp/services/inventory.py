@@ -5,6 +5,7 @@ Uses Nornir's native inventory summaries (devices, groups) without custom
 Pydantic wrappers.
 """
 
+import os
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Literal, TypedDict, cast
@@ -15,6 +16,33 @@ from nornir.core import Nornir
 from ..utils.filters import apply_filters
 
 
+def _parse_num_workers(value: str | None) -> int | None:
+    """Parse ``NORNIR_MCP_NUM_WORKERS`` into a positive worker count.
+
+    Args:
+        value: Raw environment variable value, or None if unset
+
+    Returns:
+        The worker count, or None when the variable is unset or empty
+
+    Raises:
+        ValueError: If the value is not an integer of at least 1.
+    """
+    if value is None or not value.strip():
+        return None
+    message = f"NORNIR_MCP_NUM_WORKERS must be a positive integer, got {value!r}"
+    try:
+        num_workers = int(value)
+    except ValueError as exc:
+        raise ValueError(message) from exc
+    if num_workers < 1:
+        raise ValueError(message)
+    return num_workers
+
+
+NUM_WORKERS = _parse_num_workers(os.environ.get("NORNIR_MCP_NUM_WORKERS"))
+
+
 class InventoryError(ValueError):
     """Raised when inventory operations fail."""
 
@@ -63,7 +91,9 @@ class InventorySummary(TypedDict, total=False):
 def _get_nornir() -> Nornir:
     """Initialize and return a Nornir instance from configuration file.
 
-    Looks for ``config.yaml`` in the current working directory.
+    Looks for ``config.yaml`` in the current working directory. When
+    ``NORNIR_MCP_NUM_WORKERS`` is set, the runner section of the config file
+    is replaced by a threaded runner bounded to that many workers.
 
     Raises:
         ValueError: If no configuration file is found.
@@ -73,7 +103,12 @@ def _get_nornir() -> Nornir:
         raise ValueError(
             "No Nornir config found. Create config.yaml in current directory",
         )
-    return InitNornir(config_file=str(config_file))
+    if NUM_WORKERS is None:
+        return InitNornir(config_file=str(config_file))
+    return InitNornir(
+        config_file=str(config_file),
+        runner={"plugin": "threaded", "options": {"num_workers": NUM_WORKERS}},
+    )
 
 
 def get_filtered_nornir(
@@ -3,15 +3,20 @@
 from typing import Any
 
 from nornir.core.task import Result, Task
-from nornir_netmiko.tasks import netmiko_send_command
+from nornir_netmiko.connections import CONNECTION_NAME
 
 
 def send_commands(task: Task, commands: list[str]) -> Result:
-    """Send multiple show commands over a single SSH connection."""
-    output: dict[str, Any] = {}
-    for cmd in commands:
-        result = task.run(task=netmiko_send_command, command_string=cmd)
-        output[cmd] = result[0].result
+    """Send multiple show commands over a single SSH connection.
+
+    The host's Netmiko connection is looked up once and every command is sent
+    on it directly, avoiding a Nornir subtask per command. Duplicate commands
+    are sent only once; output is keyed by command, so nothing is lost.
+    """
+    net_connect = task.host.get_connection(CONNECTION_NAME, task.nornir.config)
+    output: dict[str, Any] = {
+        cmd: net_connect.send_command(cmd) for cmd in dict.fromkeys(commands)
+    }
     return Result(host=task.host, result=output)
 
 
@@ -5,10 +5,12 @@ import logging
 import os
 import time
 from collections.abc import Callable
+from concurrent.futures import Future
 from typing import Any
 
+from nornir.core import Nornir
 from nornir.core.exceptions import NornirExecutionError
-from nornir.core.task import Result
+from nornir.core.task import AggregatedResult, Result
 
 from ..utils.results import error_response, format_results
 from .inventory import (
@@ -26,6 +28,35 @@ def _global_error(message: str, code: str) -> dict[str, dict[str, Any]]:
     return {GLOBAL_ERROR_HOST: error_response(message, code=code)}
 
 
+def _run_and_close(
+    nr: Nornir,
+    task: Callable[..., Result],
+    run_done: Future[AggregatedResult],
+    /,
+    **task_kwargs: Any,
+) -> None:
+    """Run a task, report its outcome, then close every device connection.
+
+    Every call tears down the SSH sessions it opened: the Nornir object is
+    discarded afterwards, so connections are closed here rather than left for
+    their transports to time out on the device. The outcome of ``nr.run`` is
+    set on ``run_done`` before cleanup starts, so a slow disconnect never
+    counts against the caller's timeout. A failure while closing is logged
+    and never replaces the task's own result or exception.
+    """
+    if not run_done.set_running_or_notify_cancel():
+        return
+    try:
+        run_done.set_result(nr.run(task=task, **task_kwargs))
+    except Exception as exc:  # noqa: BLE001 - re-raised by the awaiting caller
+        run_done.set_exception(exc)
+    finally:
+        try:
+            nr.close_connections(on_good=True, on_failed=True)
+        except Exception:
+            logger.exception("Failed to close device connections")
+
+
 async def execute(
     task: Callable[..., Result],
     name: str | None = None,
@@ -65,10 +96,18 @@ async def execute(
             code=exc.code,
         )
 
+    if not host_count:
+        return {}
+
     start_time = time.perf_counter()
+    run_done: Future[AggregatedResult] = Future()
+    worker = asyncio.ensure_future(
+        asyncio.to_thread(_run_and_close, nr, task, run_done, **task_kwargs)
+    )
     try:
+        # Only the run itself is timed; connection cleanup happens afterwards
         result = await asyncio.wait_for(
-            asyncio.to_thread(nr.run, task=task, **task_kwargs),
+            asyncio.wrap_future(run_done),
             timeout=TIMEOUT,
         )
         duration = time.perf_counter() - start_time
@@ -86,11 +125,13 @@ async def execute(
         )
     except NornirExecutionError as e:
         logger.exception("Nornir execution failed: %s", e)
+        await worker
         return _global_error(
             f"Nornir execution failed: {e}",
             code="execution_error",
         )
 
+    await worker
     return format_results(result)
 
 
@@ -27,25 +27,38 @@ def ensure_backup_directory(backup_dir: str | Path) -> Path:
     return path
 
 
-def write_config_to_file(hostname: str, content: str, folder: Path) -> Path:
+def backup_timestamp() -> str:
+    """Return the UTC timestamp used in backup filenames."""
+    return datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+
+
+def write_config_to_file(
+    hostname: str,
+    content: str,
+    folder: Path,
+    *,
+    timestamp: str | None = None,
+) -> Path:
     """Write configuration content to a file.
 
     Args:
         hostname: Device hostname for filename
         content: Configuration content to write
         folder: Directory path to write the file to
+        timestamp: Filename timestamp shared by a backup run; defaults to now
 
     Returns:
         Path to the written file
     """
-    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    timestamp = timestamp or backup_timestamp()
     filename = f"{hostname}_{timestamp}.cfg"
     filepath = folder / filename
-    filepath.write_text(content, encoding="utf-8")
+    filepath.write_bytes(content.encode("utf-8"))
     return filepath
 
 
 __all__: list[str] = [
+    "backup_timestamp",
     "ensure_backup_directory",
     "write_config_to_file",
 ]
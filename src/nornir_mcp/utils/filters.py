@@ -3,8 +3,11 @@
 Contains functions to apply filters to Nornir inventory using the F object.
 """
 
+import operator
+from functools import reduce
+
 from nornir.core import Nornir
-from nornir.core.filter import F
+from nornir.core.filter import F_BASE, F
 
 
 def apply_filters(
@@ -32,22 +35,27 @@ def apply_filters(
     Raises:
         ValueError: If filters result in zero matching hosts
     """
-    if not any((name, hostname, group, platform)):
+    if not (name or hostname or group or platform):
         return nr
 
     original_count = len(nr.inventory.hosts)
 
+    # AND all criteria into one expression so the inventory is walked once
+    expressions: list[F_BASE] = []
+
     if name:
-        nr = nr.filter(F(name=name))
+        expressions.append(F(name=name))
 
     if hostname:
-        nr = nr.filter(F(name=hostname) | F(hostname=hostname))
+        expressions.append(F(name=hostname) | F(hostname=hostname))
 
     if group:
-        nr = nr.filter(F(groups__contains=group))
+        expressions.append(F(groups__contains=group))
 
     if platform:
-        nr = nr.filter(F(platform=platform))
+        expressions.append(F(platform=platform))
+
+    nr = nr.filter(reduce(operator.and_, expressions))
 
     if len(nr.inventory.hosts) == 0:
         raise ValueError(
@@ -3,7 +3,7 @@
 import traceback
 from typing import Any
 
-from nornir.core.task import AggregatedResult
+from nornir.core.task import AggregatedResult, MultiResult
 
 from ..models import ErrorResponse, HostTaskResult, TaskResult
 
@@ -33,6 +33,32 @@ def error_response(
     ).model_dump(exclude_none=True)
 
 
+def _format_host(multi_result: MultiResult) -> dict[str, Any]:
+    """Shape one host's MultiResult into a HostTaskResult dictionary."""
+    if not multi_result:
+        res = HostTaskResult(
+            success=False,
+            error=ErrorResponse(code="empty_result", message="No results returned"),
+        )
+    elif multi_result.failed:
+        exc = next((r.exception for r in multi_result if r.exception), None)
+        res = HostTaskResult(
+            success=False,
+            error=ErrorResponse(
+                code="task_failed",
+                message="Task failed",
+                exception=str(exc) if exc else "Unknown error",
+                details={"traceback": "".join(traceback.format_tb(exc.__traceback__))}
+                if exc
+                else None,
+            ),
+        )
+    else:
+        res = HostTaskResult(success=True, output=multi_result[0].result)
+
+    return res.model_dump(exclude_none=True)
+
+
 def format_results(result: AggregatedResult) -> dict[str, Any]:
     """Extract Nornir results into a standardized dictionary format.
 
@@ -45,35 +71,7 @@ def format_results(result: AggregatedResult) -> dict[str, Any]:
     Returns:
         Dictionary {hostname: raw_result_data | error_dict}
     """
-    formatted: dict[str, Any] = {}
-
-    for host, multi_result in result.items():
-        if not multi_result:
-            res = HostTaskResult(
-                success=False,
-                error=ErrorResponse(code="empty_result", message="No results returned"),
-            )
-        elif multi_result.failed:
-            exc = next((r.exception for r in multi_result if r.exception), None)
-            res = HostTaskResult(
-                success=False,
-                error=ErrorResponse(
-                    code="task_failed",
-                    message="Task failed",
-                    exception=str(exc) if exc else "Unknown error",
-                    details={
-                        "traceback": "".join(traceback.format_tb(exc.__traceback__))
-                    }
-                    if exc
-                    else None,
-                ),
-            )
-        else:
-            res = HostTaskResult(success=True, output=multi_result[0].result)
-
-        formatted[host] = res.model_dump(exclude_none=True)
-
-    return formatted
+    return {host: _format_host(multi_result) for host, multi_result in result.items()}
 
 
 def wrap_task_result(raw: dict[str, Any]) -> dict[str, Any]:
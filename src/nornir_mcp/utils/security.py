@@ -1,10 +1,17 @@
 """Command validation and security utilities."""
 
+import re
+from collections.abc import Collection, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 # Simple hardcoded denylist for dangerous commands
-DENYLIST = {
-    "keywords": {"erase", "format", "delete", "reload"},
-    "patterns": [">", "<", ";", "&&", "||"],
-}
+DENYLIST_KEYWORDS: frozenset[str] = frozenset({"erase", "format", "delete", "reload"})
+DENYLIST_PATTERNS: tuple[str, ...] = (">", "<", ";", "&&", "||")
+# Read-only view kept for callers of the original dict-shaped constant
+DENYLIST: Mapping[str, Collection[str]] = MappingProxyType(
+    {"keywords": DENYLIST_KEYWORDS, "patterns": DENYLIST_PATTERNS}
+)
 
 # Allowed prefixes for read-only commands
 ALLOWED_SHOW_PREFIXES = (
@@ -16,41 +23,69 @@ ALLOWED_SHOW_PREFIXES = (
     "terminal ",
 )
 
+# All disallowed patterns folded into one alternation, compiled once
+_PATTERN_RE = re.compile("|".join(map(re.escape, DENYLIST_PATTERNS)))
 
-def validate_command(command: str, read_only: bool = False) -> str | None:
-    """Validate a command against security rules.
+_READ_ONLY_ERROR = (
+    "Only read-only commands are permitted. "
+    f"Allowed prefixes: {', '.join(p.strip() for p in ALLOWED_SHOW_PREFIXES)}"
+)
 
-    Args:
-        command: Command string to validate
-        read_only: If True, enforce allowlist prefix for read-only tools
 
-    Returns:
-        Error message if invalid, None if valid
-    """
-    command_lower = command.lower().strip()
+# Only short commands are memoized, so the cache stays small no matter what
+# clients send; longer commands are rare and validated afresh each time.
+_MAX_CACHED_COMMAND_LENGTH = 256
 
+
+def _check_command(command_lower: str, read_only: bool) -> str | None:
+    """Run the security checks on an already stripped, lowercased command."""
     # 1. For read-only tools, enforce an allowlist prefix
     if read_only:
-        if not any(command_lower.startswith(p) for p in ALLOWED_SHOW_PREFIXES):
-            return (
-                f"Only read-only commands are permitted. "
-                f"Allowed prefixes: {', '.join(p.strip() for p in ALLOWED_SHOW_PREFIXES)}"
-            )
+        if not command_lower.startswith(ALLOWED_SHOW_PREFIXES):
+            return _READ_ONLY_ERROR
+
+    # Nothing left to match once the allowlist has had its say
+    if not command_lower:
+        return None
 
-    # 2. Check disallowed patterns (redirection, command chaining)
-    for pattern in DENYLIST["patterns"]:
-        if pattern in command_lower:
-            return f"Command contains disallowed pattern: '{pattern}'"
+    # 2. Check disallowed patterns (redirection, command chaining). The error
+    # names the leftmost match in the command, not the first entry in
+    # DENYLIST_PATTERNS: 'show x ; y > z' reports ';'.
+    pattern_match = _PATTERN_RE.search(command_lower)
+    if pattern_match:
+        return f"Command contains disallowed pattern: '{pattern_match.group()}'"
 
     # 3. Check keywords - match only as the first token to reduce false positives
     # e.g., 'reload' is blocked, but 'show reload history' is allowed.
-    first_token = command_lower.split()[0] if command_lower.split() else ""
-    if first_token in DENYLIST["keywords"]:
+    first_token = command_lower.split(maxsplit=1)[0]
+    if first_token in DENYLIST_KEYWORDS:
         return f"Command starts with a blacklisted keyword: '{first_token}'"
 
     return None
 
 
+_check_command_cached = lru_cache(maxsize=1024)(_check_command)
+
+
+def validate_command(command: str, read_only: bool = False) -> str | None:
+    """Validate a command against security rules.
+
+    Results for commands of up to 256 characters are memoized on the
+    normalized command, since agents tend to resend the same commands.
+
+    Args:
+        command: Command string to validate
+        read_only: If True, enforce allowlist prefix for read-only tools
+
+    Returns:
+        Error message if invalid, None if valid
+    """
+    command_lower = command.strip().lower()
+    if len(command_lower) > _MAX_CACHED_COMMAND_LENGTH:
+        return _check_command(command_lower, read_only)
+    return _check_command_cached(command_lower, read_only)
+
+
 def validate_commands(commands: list[str], read_only: bool = False) -> str | None:
     """Validate a list of commands against security rules.
 
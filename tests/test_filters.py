@@ -1,5 +1,6 @@
 from types import SimpleNamespace
 import pytest
+from nornir.core.inventory import Group, Host, ParentGroups
 
 from nornir_mcp.utils.filters import apply_filters
 
@@ -45,7 +46,28 @@ def test_apply_filters_uses_correct_filter_expressions() -> None:
         platform="ios",
     )
 
-    assert len(nr.filter_calls) == 4
+    assert len(nr.filter_calls) == 1
+    (expression,) = nr.filter_calls
+
+    def host(
+        name: str = "leaf-1",
+        hostname: str = "10.0.0.1",
+        group: str = "spine",
+        platform: str = "ios",
+    ) -> Host:
+        return Host(
+            name,
+            hostname=hostname,
+            platform=platform,
+            groups=ParentGroups([Group(group)]),
+        )
+
+    assert expression(host())
+    # Each host misses exactly one criterion, so all filters must be ANDed
+    assert not expression(host(name="leaf-2"))
+    assert not expression(host(hostname="10.0.0.2"))
+    assert not expression(host(group="leaf"))
+    assert not expression(host(platform="eos"))
 
 
 def test_apply_filters_raises_when_no_hosts_match() -> None:
@@ -2,10 +2,24 @@ import pytest
 
 from nornir_mcp.services.inventory import (
     InventoryError,
+    _get_nornir,
+    _parse_num_workers,
     get_filtered_nornir,
 )
 
 
+@pytest.fixture
+def init_nornir_kwargs(monkeypatch, tmp_path) -> dict:
+    (tmp_path / "config.yaml").write_text("inventory: {}\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    captured: dict = {}
+    monkeypatch.setattr(
+        "nornir_mcp.services.inventory.InitNornir",
+        lambda **kwargs: captured.update(kwargs),
+    )
+    return captured
+
+
 def test_get_filtered_nornir_reloads_inventory_on_every_call(monkeypatch) -> None:
     calls = {"count": 0}
 
@@ -51,3 +65,37 @@ def test_get_filtered_nornir_wraps_filter_errors(monkeypatch) -> None:
 
     with pytest.raises(InventoryError, match="bad filters"):
         get_filtered_nornir()
+
+
+def test_get_nornir_uses_config_runner_by_default(
+    monkeypatch, tmp_path, init_nornir_kwargs
+) -> None:
+    monkeypatch.setattr("nornir_mcp.services.inventory.NUM_WORKERS", None)
+
+    _get_nornir()
+
+    assert init_nornir_kwargs == {"config_file": str(tmp_path / "config.yaml")}
+
+
+def test_get_nornir_bounds_runner_workers_from_env(
+    monkeypatch, init_nornir_kwargs
+) -> None:
+    monkeypatch.setattr("nornir_mcp.services.inventory.NUM_WORKERS", 8)
+
+    _get_nornir()
+
+    assert init_nornir_kwargs["runner"] == {
+        "plugin": "threaded",
+        "options": {"num_workers": 8},
+    }
+
+
+@pytest.mark.parametrize(("value", "expected"), [(None, None), ("", None), ("4", 4)])
+def test_parse_num_workers(value, expected) -> None:
+    assert _parse_num_workers(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_parse_num_workers_rejects_non_positive_values(value) -> None:
+    with pytest.raises(ValueError, match="NORNIR_MCP_NUM_WORKERS must be a positive"):
+        _parse_num_workers(value)
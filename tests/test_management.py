@@ -1,5 +1,6 @@
 from pathlib import Path
 import asyncio
+import itertools
 
 from nornir_mcp.models import ErrorResponse, TaskResult
 from nornir_mcp.services.runner import GLOBAL_ERROR_HOST
@@ -71,6 +72,33 @@ def test_backup_device_configs_writes_config(monkeypatch, tmp_path: Path) -> Non
     assert saved_path.read_text(encoding="utf-8") == "hostname leaf-1"
 
 
+def test_backup_device_configs_shares_timestamp_across_hosts(
+    monkeypatch, tmp_path: Path
+) -> None:
+    async def fake_execute(**kwargs):
+        return {
+            host: {
+                "success": True,
+                "output": {"config": {"running": f"hostname {host}"}},
+            }
+            for host in ("leaf-1", "leaf-2")
+        }
+
+    calls = itertools.count()
+    monkeypatch.setattr("nornir_mcp.services.napalm.execute", fake_execute)
+    monkeypatch.setattr(
+        "nornir_mcp.services.backup.backup_timestamp",
+        lambda: f"ts{next(calls)}",
+    )
+
+    result = asyncio.run(backup_device_configs.fn(path=str(tmp_path)))
+
+    assert next(calls) == 1
+    assert {
+        host: Path(record["path"]).name for host, record in result["hosts"].items()
+    } == {"leaf-1": "leaf-1_ts0.cfg", "leaf-2": "leaf-2_ts0.cfg"}
+
+
 def test_backup_device_configs_returns_hosts_key(monkeypatch, tmp_path: Path) -> None:
     async def fake_execute(**kwargs):
         return {
@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+from typing import Any
+
+from nornir_mcp.services.netmiko import send_commands
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    def send_command(self, command: str) -> str:
+        self.sent.append(command)
+        return f"output of {command}"
+
+
+class FakeHost:
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection = connection
+        self.lookups: list[str] = []
+
+    def get_connection(self, connection: str, configuration: Any) -> FakeConnection:
+        self.lookups.append(connection)
+        return self.connection
+
+
+def test_send_commands_reuses_one_connection() -> None:
+    connection = FakeConnection()
+    host = FakeHost(connection)
+    task = SimpleNamespace(host=host, nornir=SimpleNamespace(config=None))
+
+    result = send_commands(task, commands=["show version", "show clock"])
+
+    assert host.lookups == ["netmiko"]
+    assert connection.sent == ["show version", "show clock"]
+    assert result.result == {
+        "show version": "output of show version",
+        "show clock": "output of show clock",
+    }
+
+
+def test_send_commands_sends_duplicate_commands_once() -> None:
+    connection = FakeConnection()
+    task = SimpleNamespace(
+        host=FakeHost(connection), nornir=SimpleNamespace(config=None)
+    )
+
+    result = send_commands(task, commands=["show clock", "show version", "show clock"])
+
+    assert connection.sent == ["show clock", "show version"]
+    assert list(result.result) == ["show clock", "show version"]
@@ -1,23 +1,43 @@
 import asyncio
+import time
 from collections.abc import Callable
+from concurrent.futures import Future
 from types import SimpleNamespace
 from typing import Any
 
 from nornir.core.exceptions import NornirExecutionError
+from nornir.core.task import AggregatedResult, MultiResult, Result
 
 from nornir_mcp.models import ErrorResponse
 from nornir_mcp.services.inventory import InventoryError
-from nornir_mcp.services.runner import GLOBAL_ERROR_HOST, execute
+from nornir_mcp.services.runner import GLOBAL_ERROR_HOST, _run_and_close, execute
 
 
 class FakeNornir:
-    def __init__(self, run_impl: Callable[..., Any]) -> None:
+    def __init__(
+        self,
+        run_impl: Callable[..., Any],
+        hosts: dict[str, Any] | None = None,
+        close_error: Exception | None = None,
+        close_delay: float = 0,
+    ) -> None:
         self.run_impl = run_impl
-        self.inventory = SimpleNamespace(hosts={})
+        self.inventory = SimpleNamespace(
+            hosts={"leaf-1": object()} if hosts is None else hosts
+        )
+        self.close_error = close_error
+        self.close_delay = close_delay
+        self.closed = False
 
     def run(self, **kwargs: Any) -> Any:
         return self.run_impl(**kwargs)
 
+    def close_connections(self, on_good: bool, on_failed: bool) -> None:
+        time.sleep(self.close_delay)
+        if self.close_error is not None:
+            raise self.close_error
+        self.closed = on_good and on_failed
+
 
 class FakeSubResult:
     name = "task"
@@ -99,3 +119,77 @@ def test_execute_global_error_conforms_to_error_response_shape(monkeypatch) -> N
 
     assert GLOBAL_ERROR_HOST in result
     ErrorResponse.model_validate(result[GLOBAL_ERROR_HOST])
+
+
+def test_execute_skips_runner_when_inventory_is_empty(monkeypatch) -> None:
+    def fail_run(**kwargs: Any) -> Any:
+        raise AssertionError("runner should not be invoked")
+
+    monkeypatch.setattr(
+        "nornir_mcp.services.runner.get_filtered_nornir",
+        lambda **kwargs: FakeNornir(run_impl=fail_run, hosts={}),
+    )
+
+    result = asyncio.run(execute(task=lambda **_: None))
+
+    assert result == {}
+
+
+def test_execute_closes_connections_after_failed_run(monkeypatch) -> None:
+    def raise_execution_error(**kwargs: Any) -> Any:
+        raise NornirExecutionError({"leaf-1": FakeMultiResult([FakeSubResult()])})
+
+    nr = FakeNornir(run_impl=raise_execution_error)
+    monkeypatch.setattr(
+        "nornir_mcp.services.runner.get_filtered_nornir", lambda **kwargs: nr
+    )
+
+    asyncio.run(execute(task=lambda **_: None))
+
+    assert nr.closed is True
+
+
+def test_run_and_close_reports_result_and_closes_connections() -> None:
+    nr = FakeNornir(run_impl=lambda **kwargs: kwargs)
+    run_done: Future[Any] = Future()
+
+    _run_and_close(nr, None, run_done, commands=["show version"])
+
+    assert run_done.result() == {"task": None, "commands": ["show version"]}
+    assert nr.closed is True
+
+
+def test_execute_does_not_time_out_on_slow_connection_close(monkeypatch) -> None:
+    def run_ok(**kwargs: Any) -> AggregatedResult:
+        multi_result = MultiResult("task")
+        multi_result.append(Result(host=None, result="ok"))
+        result = AggregatedResult("task")
+        result["leaf-1"] = multi_result
+        return result
+
+    nr = FakeNornir(run_impl=run_ok, close_delay=0.5)
+    monkeypatch.setattr("nornir_mcp.services.runner.TIMEOUT", 0.2)
+    monkeypatch.setattr(
+        "nornir_mcp.services.runner.get_filtered_nornir", lambda **kwargs: nr
+    )
+
+    result = asyncio.run(execute(task=lambda **_: None))
+
+    assert result == {"leaf-1": {"success": True, "output": "ok"}}
+    assert nr.closed is True
+
+
+def test_execute_keeps_run_error_when_closing_connections_fails(monkeypatch) -> None:
+    def raise_execution_error(**kwargs: Any) -> Any:
+        raise NornirExecutionError({"leaf-1": FakeMultiResult([FakeSubResult()])})
+
+    monkeypatch.setattr(
+        "nornir_mcp.services.runner.get_filtered_nornir",
+        lambda **kwargs: FakeNornir(
+            run_impl=raise_execution_error, close_error=ValueError("close failed")
+        ),
+    )
+
+    result = asyncio.run(execute(task=lambda **_: None))
+
+    assert result[GLOBAL_ERROR_HOST]["code"] == "execution_error"
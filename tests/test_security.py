@@ -1,4 +1,11 @@
-from nornir_mcp.utils.security import validate_command
+from nornir_mcp.utils.security import (
+    DENYLIST,
+    DENYLIST_KEYWORDS,
+    DENYLIST_PATTERNS,
+    _check_command_cached,
+    validate_command,
+    validate_commands,
+)
 
 
 def test_validate_command_rejects_dangerous_pattern() -> None:
@@ -6,6 +13,16 @@ def test_validate_command_rejects_dangerous_pattern() -> None:
         validate_command("show version ; reload")
         == "Command contains disallowed pattern: ';'"
     )
+    assert (
+        validate_command("show clock || reload")
+        == "Command contains disallowed pattern: '||'"
+    )
+
+
+def test_validate_command_reports_leftmost_pattern() -> None:
+    assert (
+        validate_command("show x ; y > z") == "Command contains disallowed pattern: ';'"
+    )
 
 
 def test_validate_command_rejects_blacklisted_keyword() -> None:
@@ -29,3 +46,41 @@ def test_validate_command_allows_read_only_show_command() -> None:
         validate_command("config t", read_only=True)
         == "Only read-only commands are permitted. Allowed prefixes: show, display, get, ping, traceroute, terminal"
     )
+
+
+def test_validate_command_checks_allowlist_before_empty_input() -> None:
+    assert validate_command("", read_only=True) == (
+        "Only read-only commands are permitted. Allowed prefixes: show, display, get, ping, traceroute, terminal"
+    )
+    assert validate_command("   ", read_only=True) is not None
+    assert validate_command("   ") is None
+
+
+def test_validate_commands_returns_first_error() -> None:
+    assert validate_commands(["show version", "show clock"], read_only=True) is None
+    assert (
+        validate_commands(["show version", "show run > flash:x", "reload"])
+        == "Command contains disallowed pattern: '>'"
+    )
+
+
+def test_validate_command_memoizes_short_normalized_commands() -> None:
+    _check_command_cached.cache_clear()
+
+    assert validate_command("show version") is None
+    assert validate_command("  SHOW VERSION ") is None
+
+    assert _check_command_cached.cache_info().hits == 1
+
+
+def test_validate_command_does_not_cache_long_commands() -> None:
+    _check_command_cached.cache_clear()
+
+    assert validate_command("show " + "x" * 300) is None
+
+    assert _check_command_cached.cache_info().currsize == 0
+
+
+def test_denylist_view_exposes_module_constants() -> None:
+    assert DENYLIST["keywords"] is DENYLIST_KEYWORDS
+    assert DENYLIST["patterns"] is DENYLIST_PATTERNS